@@ -3,6 +3,11 @@ from asyncio import run
 
 from src.application import TikTokDownloader
 
+try:
+    from uvloop import new_event_loop
+except ImportError:
+    new_event_loop = None
+
 
 async def main():
     async with TikTokDownloader() as downloader:
@@ -16,4 +21,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    run(main())
+    run(main(), loop_factory=new_event_loop)
@@ -1,8 +1,14 @@
+from asyncio import gather
+from contextlib import asynccontextmanager
+from logging import getLogger
 from textwrap import dedent
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from fastapi import Depends, FastAPI, Header, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse, StreamingResponse
+from orjson import dumps
 from uvicorn import Config, Server
 
 from ..custom import (
@@ -10,6 +16,7 @@ from ..custom import (
     REPOSITORY,
     SERVER_HOST,
     SERVER_PORT,
+    SERVER_REQUEST_LOG,
     VERSION_BETA,
     is_valid_token,
 )
@@ -33,17 +40,226 @@ from ..models import (
     UserSearch,
     VideoSearch,
 )
+from ..record import setup_api_monitoring
 from ..translation import _
 from .main_terminal import TikTok
 
 if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
     from ..config import Parameter
     from ..manager import Database
 
 __all__ = ["APIServer"]
 
-
-def token_dependency(token: str = Header(None)):
+logger = getLogger("API_MONITOR")
+
+DESCRIPTION_TOKEN = dedent("""
+    项目默认无需令牌；公开部署时，建议设置令牌以防止恶意请求！
+
+    令牌设置位置：`src/custom/function.py` - `TOKEN`
+""")
+
+DESCRIPTION_SETTINGS = dedent("""
+    更新项目配置文件 settings.json
+
+    仅需传入需要更新的配置参数
+
+    返回更新后的全部配置参数
+""")
+
+DESCRIPTION_SHARE = dedent("""
+    **参数**:
+
+    - **text**: 包含分享链接的字符串；必需参数
+    - **proxy**: 代理；可选参数
+""")
+
+DESCRIPTION_DOUYIN_DETAIL = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **detail_id**: 抖音作品 ID；必需参数
+""")
+
+DESCRIPTION_DOUYIN_ACCOUNT = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **sec_user_id**: 抖音账号 sec_uid；必需参数
+    - **tab**: 账号页面类型；可选参数，默认值：`post`
+    - **earliest**: 作品最早发布日期；可选参数
+    - **latest**: 作品最晚发布日期；可选参数
+    - **pages**: 最大请求次数，仅对请求账号喜欢页数据有效；可选参数
+    - **cursor**: 可选参数
+    - **count**: 可选参数
+""")
+
+DESCRIPTION_DOUYIN_MIX = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **mix_id**: 抖音合集 ID
+    - **detail_id**: 属于合集的抖音作品 ID
+    - **cursor**: 可选参数
+    - **count**: 可选参数
+
+    **`mix_id` 和 `detail_id` 二选一，只需传入其中之一即可**
+""")
+
+DESCRIPTION_DOUYIN_LIVE = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **web_rid**: 抖音直播 web_rid
+""")
+
+DESCRIPTION_DOUYIN_COMMENT = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **detail_id**: 抖音作品 ID；必需参数
+    - **pages**: 最大请求次数；可选参数
+    - **cursor**: 可选参数
+    - **count**: 可选参数
+    - **count_reply**: 可选参数
+    - **reply**: 可选参数，默认值：False
+""")
+
+DESCRIPTION_DOUYIN_REPLY = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **detail_id**: 抖音作品 ID；必需参数
+    - **comment_id**: 评论 ID；必需参数
+    - **pages**: 最大请求次数；可选参数
+    - **cursor**: 可选参数
+    - **count**: 可选参数
+""")
+
+DESCRIPTION_DOUYIN_SEARCH_GENERAL = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **keyword**: 关键词；必需参数
+    - **offset**: 起始页码；可选参数
+    - **count**: 数据数量；可选参数
+    - **pages**: 总页数；可选参数
+    - **sort_type**: 排序依据；可选参数
+    - **publish_time**: 发布时间；可选参数
+    - **duration**: 视频时长；可选参数
+    - **search_range**: 搜索范围；可选参数
+    - **content_type**: 内容形式；可选参数
+
+    **部分参数传入规则请查阅文档**: [参数含义](https://github.com/JoeanAmier/TikTokDownloader/wiki/Documentation#%E9%87%87%E9%9B%86%E6%90%9C%E7%B4%A2%E7%BB%93%E6%9E%9C%E6%95%B0%E6%8D%AE%E6%8A%96%E9%9F%B3)
+""")
+
+DESCRIPTION_DOUYIN_SEARCH_VIDEO = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **keyword**: 关键词；必需参数
+    - **offset**: 起始页码；可选参数
+    - **count**: 数据数量；可选参数
+    - **pages**: 总页数；可选参数
+    - **sort_type**: 排序依据；可选参数
+    - **publish_time**: 发布时间；可选参数
+    - **duration**: 视频时长；可选参数
+    - **search_range**: 搜索范围；可选参数
+
+    **部分参数传入规则请查阅文档**: [参数含义](https://github.com/JoeanAmier/TikTokDownloader/wiki/Documentation#%E9%87%87%E9%9B%86%E6%90%9C%E7%B4%A2%E7%BB%93%E6%9E%9C%E6%95%B0%E6%8D%AE%E6%8A%96%E9%9F%B3)
+""")
+
+DESCRIPTION_DOUYIN_SEARCH_USER = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **keyword**: 关键词；必需参数
+    - **offset**: 起始页码；可选参数
+    - **count**: 数据数量；可选参数
+    - **pages**: 总页数；可选参数
+    - **douyin_user_fans**: 粉丝数量；可选参数
+    - **douyin_user_type**: 用户类型；可选参数
+
+    **部分参数传入规则请查阅文档**: [参数含义](https://github.com/JoeanAmier/TikTokDownloader/wiki/Documentation#%E9%87%87%E9%9B%86%E6%90%9C%E7%B4%A2%E7%BB%93%E6%9E%9C%E6%95%B0%E6%8D%AE%E6%8A%96%E9%9F%B3)
+""")
+
+DESCRIPTION_DOUYIN_SEARCH_LIVE = dedent("""
+    **参数**:
+
+    - **cookie**: 抖音 Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **keyword**: 关键词；必需参数
+    - **offset**: 起始页码；可选参数
+    - **count**: 数据数量；可选参数
+    - **pages**: 总页数；可选参数
+""")
+
+DESCRIPTION_TIKTOK_DETAIL = dedent("""
+    **参数**:
+
+    - **cookie**: TikTok Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **detail_id**: TikTok 作品 ID；必需参数
+""")
+
+DESCRIPTION_TIKTOK_ACCOUNT = dedent("""
+    **参数**:
+
+    - **cookie**: TikTok Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **sec_user_id**: TikTok 账号 secUid；必需参数
+    - **tab**: 账号页面类型；可选参数，默认值：`post`
+    - **earliest**: 作品最早发布日期；可选参数
+    - **latest**: 作品最晚发布日期；可选参数
+    - **pages**: 最大请求次数，仅对请求账号喜欢页数据有效；可选参数
+    - **cursor**: 可选参数
+    - **count**: 可选参数
+""")
+
+DESCRIPTION_TIKTOK_MIX = dedent("""
+    **参数**:
+
+    - **cookie**: TikTok Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **mix_id**: TikTok 合集 ID；必需参数
+    - **cursor**: 可选参数
+    - **count**: 可选参数
+""")
+
+DESCRIPTION_TIKTOK_LIVE = dedent("""
+    **参数**:
+
+    - **cookie**: TikTok Cookie；可选参数
+    - **proxy**: 代理；可选参数
+    - **source**: 是否返回原始响应数据；可选参数，默认值：False
+    - **room_id**: TikTok 直播 room_id；必需参数
+""")
+
+
+async def token_dependency(token: str = Header(None)):
     if not is_valid_token(token):
         raise HTTPException(
             status_code=403,
@@ -51,6 +267,38 @@ def token_dependency(token: str = Header(None)):
         )
 
 
+class LogMiddleware:
+    """记录 Web API 请求日志"""
+
+    def __init__(self, app: "ASGIApp"):
+        self.app = app
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send"):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start = perf_counter()
+        status = 500
+
+        async def send_wrapper(message: "Message"):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            client = scope.get("client")
+            logger.info(
+                "req %s %s client=%s status=%s t=%.3f",
+                scope["method"],
+                scope["path"],
+                client[0] if client else "-",
+                status,
+                perf_counter() - start,
+            )
+
+
 class APIServer(TikTok):
     def __init__(
         self,
@@ -89,17 +337,48 @@ class APIServer(TikTok):
             debug=VERSION_BETA,
             title="DouK-Downloader",
             version=__VERSION__,
+            default_response_class=ORJSONResponse,
+            lifespan=self.lifespan,
         )
+        self.server.add_middleware(
+            GZipMiddleware,
+            minimum_size=1024,
+            compresslevel=5,
+        )
+        if SERVER_REQUEST_LOG:
+            self.server.add_middleware(LogMiddleware)
         self.setup_routes()
         config = Config(
             self.server,
             host=host,
             port=port,
             log_level=log_level,
+            access_log=False,
+            proxy_headers=False,
+            server_header=False,
+            date_header=False,
+            http="httptools",
+            interface="asgi3",
+            limit_concurrency=1000,
+            timeout_keep_alive=30,
+            backlog=2048,
         )
         server = Server(config)
         await server.serve()
 
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        app.openapi()
+        if not SERVER_REQUEST_LOG:
+            yield
+            return
+        listener = setup_api_monitoring()
+        listener.start()
+        try:
+            yield
+        finally:
+            listener.stop()
+
     def setup_routes(self):
         @self.server.get(
             "/",
@@ -113,13 +392,7 @@ class APIServer(TikTok):
         @self.server.get(
             "/token",
             summary=_("测试令牌有效性"),
-            description=_(
-                dedent("""
-                项目默认无需令牌；公开部署时，建议设置令牌以防止恶意请求！
-                
-                令牌设置位置：`src/custom/function.py` - `is_valid_token()`
-                """)
-            ),
+            description=_(DESCRIPTION_TOKEN),
             tags=[_("项目")],
             response_model=DataResponse,
         )
@@ -133,15 +406,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/settings",
             summary=_("更新项目全局配置"),
-            description=_(
-                dedent("""
-                更新项目配置文件 settings.json
-                
-                仅需传入需要更新的配置参数
-                
-                返回更新后的全部配置参数
-                """)
-            ),
+            description=_(DESCRIPTION_SETTINGS),
             tags=[_("配置")],
             response_model=Settings,
         )
@@ -149,7 +414,7 @@ class APIServer(TikTok):
             extract: Settings, token: str = Depends(token_dependency)
         ):
             await self.parameter.set_settings_data(extract.model_dump())
-            return Settings(**self.parameter.get_settings_data())
+            return self.parameter.get_settings_data()
 
         @self.server.get(
             "/settings",
@@ -159,50 +424,24 @@ class APIServer(TikTok):
             response_model=Settings,
         )
         async def get_settings(token: str = Depends(token_dependency)):
-            return Settings(**self.parameter.get_settings_data())
+            return self.parameter.get_settings_data()
 
         @self.server.post(
             "/douyin/share",
             summary=_("获取分享链接重定向的完整链接"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **text**: 包含分享链接的字符串；必需参数
-                - **proxy**: 代理；可选参数
-                """)
-            ),
+            description=_(DESCRIPTION_SHARE),
             tags=[_("抖音")],
             response_model=UrlResponse,
         )
         async def handle_share(
             extract: ShortUrl, token: str = Depends(token_dependency)
         ):
-            if url := await self.handle_redirect(extract.text, extract.proxy):
-                return UrlResponse(
-                    message=_("请求链接成功！"),
-                    url=url,
-                    params=extract.model_dump(),
-                )
-            return UrlResponse(
-                message=_("请求链接失败！"),
-                url=None,
-                params=extract.model_dump(),
-            )
+            return await self.handle_share(extract, False)
 
         @self.server.post(
             "/douyin/detail",
             summary=_("获取单个作品数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **detail_id**: 抖音作品 ID；必需参数
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_DETAIL),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -214,22 +453,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/account",
             summary=_("获取账号作品数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **sec_user_id**: 抖音账号 sec_uid；必需参数
-                - **tab**: 账号页面类型；可选参数，默认值：`post`
-                - **earliest**: 作品最早发布日期；可选参数
-                - **latest**: 作品最晚发布日期；可选参数
-                - **pages**: 最大请求次数，仅对请求账号喜欢页数据有效；可选参数
-                - **cursor**: 可选参数
-                - **count**: 可选参数
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_ACCOUNT),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -238,24 +462,22 @@ class APIServer(TikTok):
         ):
             return await self.handle_account(extract, False)
 
+        @self.server.post(
+            "/douyin/account/stream",
+            summary=_("逐页获取账号作品数据"),
+            description=_(DESCRIPTION_DOUYIN_ACCOUNT),
+            tags=[_("抖音")],
+            response_class=StreamingResponse,
+        )
+        async def handle_account_stream(
+            extract: Account, token: str = Depends(token_dependency)
+        ):
+            return self.handle_account_stream(extract, False)
+
         @self.server.post(
             "/douyin/mix",
             summary=_("获取合集作品数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **mix_id**: 抖音合集 ID
-                - **detail_id**: 属于合集的抖音作品 ID
-                - **cursor**: 可选参数
-                - **count**: 可选参数
-                
-                **`mix_id` 和 `detail_id` 二选一，只需传入其中之一即可**
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_MIX),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -268,7 +490,7 @@ class APIServer(TikTok):
                 return DataResponse(
                     message=_("参数错误！"),
                     data=None,
-                    params=extract.model_dump(),
+                    params=self.dump_params(extract),
                 )
             if data := await self.deal_mix_detail(
                 is_mix,
@@ -286,16 +508,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/live",
             summary=_("获取直播数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **web_rid**: 抖音直播 web_rid
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_LIVE),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -324,21 +537,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/comment",
             summary=_("获取作品评论数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **detail_id**: 抖音作品 ID；必需参数
-                - **pages**: 最大请求次数；可选参数
-                - **cursor**: 可选参数
-                - **count**: 可选参数
-                - **count_reply**: 可选参数
-                - **reply**: 可选参数，默认值：False
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_COMMENT),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -362,20 +561,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/reply",
             summary=_("获取评论回复数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **detail_id**: 抖音作品 ID；必需参数
-                - **comment_id**: 评论 ID；必需参数
-                - **pages**: 最大请求次数；可选参数
-                - **cursor**: 可选参数
-                - **count**: 可选参数
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_REPLY),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -396,26 +582,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/search/general",
             summary=_("获取综合搜索数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **keyword**: 关键词；必需参数
-                - **offset**: 起始页码；可选参数
-                - **count**: 数据数量；可选参数
-                - **pages**: 总页数；可选参数
-                - **sort_type**: 排序依据；可选参数
-                - **publish_time**: 发布时间；可选参数
-                - **duration**: 视频时长；可选参数
-                - **search_range**: 搜索范围；可选参数
-                - **content_type**: 内容形式；可选参数
-                
-                **部分参数传入规则请查阅文档**: [参数含义](https://github.com/JoeanAmier/TikTokDownloader/wiki/Documentation#%E9%87%87%E9%9B%86%E6%90%9C%E7%B4%A2%E7%BB%93%E6%9E%9C%E6%95%B0%E6%8D%AE%E6%8A%96%E9%9F%B3)
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_SEARCH_GENERAL),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -427,25 +594,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/search/video",
             summary=_("获取视频搜索数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **keyword**: 关键词；必需参数
-                - **offset**: 起始页码；可选参数
-                - **count**: 数据数量；可选参数
-                - **pages**: 总页数；可选参数
-                - **sort_type**: 排序依据；可选参数
-                - **publish_time**: 发布时间；可选参数
-                - **duration**: 视频时长；可选参数
-                - **search_range**: 搜索范围；可选参数
-                
-                **部分参数传入规则请查阅文档**: [参数含义](https://github.com/JoeanAmier/TikTokDownloader/wiki/Documentation#%E9%87%87%E9%9B%86%E6%90%9C%E7%B4%A2%E7%BB%93%E6%9E%9C%E6%95%B0%E6%8D%AE%E6%8A%96%E9%9F%B3)
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_SEARCH_VIDEO),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -457,23 +606,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/search/user",
             summary=_("获取用户搜索数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **keyword**: 关键词；必需参数
-                - **offset**: 起始页码；可选参数
-                - **count**: 数据数量；可选参数
-                - **pages**: 总页数；可选参数
-                - **douyin_user_fans**: 粉丝数量；可选参数
-                - **douyin_user_type**: 用户类型；可选参数
-                
-                **部分参数传入规则请查阅文档**: [参数含义](https://github.com/JoeanAmier/TikTokDownloader/wiki/Documentation#%E9%87%87%E9%9B%86%E6%90%9C%E7%B4%A2%E7%BB%93%E6%9E%9C%E6%95%B0%E6%8D%AE%E6%8A%96%E9%9F%B3)
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_SEARCH_USER),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -485,19 +618,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/douyin/search/live",
             summary=_("获取直播搜索数据"),
-            description=_(
-                dedent("""
-                **参数**:
-                
-                - **cookie**: 抖音 Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **keyword**: 关键词；必需参数
-                - **offset**: 起始页码；可选参数
-                - **count**: 数据数量；可选参数
-                - **pages**: 总页数；可选参数
-                """)
-            ),
+            description=_(DESCRIPTION_DOUYIN_SEARCH_LIVE),
             tags=[_("抖音")],
             response_model=DataResponse,
         )
@@ -509,45 +630,19 @@ class APIServer(TikTok):
         @self.server.post(
             "/tiktok/share",
             summary=_("获取分享链接重定向的完整链接"),
-            description=_(
-                dedent("""
-            **参数**:
-
-            - **text**: 包含分享链接的字符串；必需参数
-            - **proxy**: 代理；可选参数
-            """)
-            ),
+            description=_(DESCRIPTION_SHARE),
             tags=["TikTok"],
             response_model=UrlResponse,
         )
         async def handle_share_tiktok(
             extract: ShortUrl, token: str = Depends(token_dependency)
         ):
-            if url := await self.handle_redirect_tiktok(extract.text, extract.proxy):
-                return UrlResponse(
-                    message=_("请求链接成功！"),
-                    url=url,
-                    params=extract.model_dump(),
-                )
-            return UrlResponse(
-                message=_("请求链接失败！"),
-                url=None,
-                params=extract.model_dump(),
-            )
+            return await self.handle_share(extract, True)
 
         @self.server.post(
             "/tiktok/detail",
             summary=_("获取单个作品数据"),
-            description=_(
-                dedent("""
-                **参数**:
-
-                - **cookie**: TikTok Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **detail_id**: TikTok 作品 ID；必需参数
-                """)
-            ),
+            description=_(DESCRIPTION_TIKTOK_DETAIL),
             tags=["TikTok"],
             response_model=DataResponse,
         )
@@ -559,22 +654,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/tiktok/account",
             summary=_("获取账号作品数据"),
-            description=_(
-                dedent("""
-                **参数**:
-
-                - **cookie**: TikTok Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **sec_user_id**: TikTok 账号 secUid；必需参数
-                - **tab**: 账号页面类型；可选参数，默认值：`post`
-                - **earliest**: 作品最早发布日期；可选参数
-                - **latest**: 作品最晚发布日期；可选参数
-                - **pages**: 最大请求次数，仅对请求账号喜欢页数据有效；可选参数
-                - **cursor**: 可选参数
-                - **count**: 可选参数
-                """)
-            ),
+            description=_(DESCRIPTION_TIKTOK_ACCOUNT),
             tags=["TikTok"],
             response_model=DataResponse,
         )
@@ -583,21 +663,22 @@ class APIServer(TikTok):
         ):
             return await self.handle_account(extract, True)
 
+        @self.server.post(
+            "/tiktok/account/stream",
+            summary=_("逐页获取账号作品数据"),
+            description=_(DESCRIPTION_TIKTOK_ACCOUNT),
+            tags=["TikTok"],
+            response_class=StreamingResponse,
+        )
+        async def handle_account_stream_tiktok(
+            extract: AccountTiktok, token: str = Depends(token_dependency)
+        ):
+            return self.handle_account_stream(extract, True)
+
         @self.server.post(
             "/tiktok/mix",
             summary=_("获取合辑作品数据"),
-            description=_(
-                dedent("""
-                **参数**:
-
-                - **cookie**: TikTok Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **mix_id**: TikTok 合集 ID；必需参数
-                - **cursor**: 可选参数
-                - **count**: 可选参数
-                """)
-            ),
+            description=_(DESCRIPTION_TIKTOK_MIX),
             tags=["TikTok"],
             response_model=DataResponse,
         )
@@ -620,16 +701,7 @@ class APIServer(TikTok):
         @self.server.post(
             "/tiktok/live",
             summary=_("获取直播数据"),
-            description=_(
-                dedent("""
-                **参数**:
-
-                - **cookie**: TikTok Cookie；可选参数
-                - **proxy**: 代理；可选参数
-                - **source**: 是否返回原始响应数据；可选参数，默认值：False
-                - **room_id**: TikTok 直播 room_id；必需参数
-                """)
-            ),
+            description=_(DESCRIPTION_TIKTOK_LIVE),
             tags=["TikTok"],
             response_model=DataResponse,
         )
@@ -643,6 +715,30 @@ class APIServer(TikTok):
                 return self.success_response(extract, data[0])
             return self.failed_response(extract)
 
+    async def handle_share(
+        self,
+        extract: ShortUrl,
+        tiktok=False,
+    ):
+        redirect = self.handle_redirect_tiktok if tiktok else self.handle_redirect
+        if isinstance(extract.text, list):
+            url = [
+                None if isinstance(i, BaseException) else i or None
+                for i in await gather(
+                    *(redirect(i, extract.proxy) for i in extract.text),
+                    return_exceptions=True,
+                )
+            ]
+            success = any(url)
+        else:
+            url = await redirect(extract.text, extract.proxy) or None
+            success = bool(url)
+        return UrlResponse(
+            message=_("请求链接成功！") if success else _("请求链接失败！"),
+            url=url,
+            params=self.dump_params(extract),
+        )
+
     async def handle_search(self, extract):
         if isinstance(
             data := await self.deal_search_data(
@@ -662,7 +758,10 @@ class APIServer(TikTok):
         extract: Detail | DetailTikTok,
         tiktok=False,
     ):
-        root, params, logger = self.record.run(self.parameter)
+        root, params, logger = self.record.run(
+            self.parameter,
+            blank=True,
+        )
         async with logger(root, console=self.console, **params) as record:
             if data := await self._handle_detail(
                 [extract.detail_id],
@@ -699,29 +798,63 @@ class APIServer(TikTok):
             return self.success_response(extract, data)
         return self.failed_response(extract)
 
-    @staticmethod
+    def handle_account_stream(
+        self,
+        extract: Account | AccountTiktok,
+        tiktok=False,
+    ) -> StreamingResponse:
+        async def generate():
+            async for data in self.deal_account_detail_stream(
+                extract.sec_user_id,
+                tab=extract.tab,
+                earliest=extract.earliest,
+                latest=extract.latest,
+                pages=extract.pages,
+                source=extract.source,
+                cookie=extract.cookie,
+                proxy=extract.proxy,
+                tiktok=tiktok,
+                cursor=extract.cursor,
+                count=extract.count,
+            ):
+                for item in data:
+                    yield dumps(item) + b"\n"
+
+        return StreamingResponse(
+            generate(),
+            media_type="application/x-ndjson",
+        )
+
+    @classmethod
     def success_response(
+        cls,
         extract,
         data: dict | list[dict],
         message: str = None,
     ):
-        return DataResponse(
+        return DataResponse.model_construct(
             message=message or _("获取数据成功！"),
             data=data,
-            params=extract.model_dump(),
+            params=cls.dump_params(extract),
         )
 
-    @staticmethod
+    @classmethod
     def failed_response(
+        cls,
         extract,
         message: str = None,
     ):
-        return DataResponse(
+        return DataResponse.model_construct(
             message=message or _("获取数据失败！"),
             data=None,
-            params=extract.model_dump(),
+            params=cls.dump_params(extract),
         )
 
+    @staticmethod
+    def dump_params(extract) -> dict:
+        """响应数据中的请求参数，不回传 Cookie"""
+        return extract.model_dump(exclude={"cookie"})
+
     @staticmethod
     def generate_mix_params(mix_id: str = None, detail_id: str = None):
         if mix_id:
@@ -734,7 +867,7 @@ class APIServer(TikTok):
         room_id: str = None,
         sec_user_id: str = None,
     ) -> bool:
-        return bool(web_rid or room_id and sec_user_id)
+        return bool(web_rid or (room_id and sec_user_id))
 
     async def handle_live(self, extract: Live | LiveTikTok, tiktok=False):
         if tiktok:
@@ -1,3 +1,4 @@
+from asyncio import Queue, create_task
 from datetime import date, datetime
 from pathlib import Path
 from platform import system
@@ -660,6 +661,100 @@ class TikTok:
             pages,
         ).run()
 
+    async def deal_account_detail_stream(
+        self,
+        sec_user_id: str,
+        tab="post",
+        earliest="",
+        latest="",
+        pages: int = None,
+        source=False,
+        cookie: str = None,
+        proxy: str = None,
+        tiktok=False,
+        cursor=0,
+        count=18,
+    ):
+        """逐页获取并提取账号作品数据，每获取一页数据返回一次，仅适用于 Web API 模式"""
+        acquirer = (AccountTikTok if tiktok else Account)(
+            self.parameter,
+            cookie,
+            proxy,
+            sec_user_id,
+            tab,
+            earliest,
+            latest,
+            pages,
+            cursor,
+            count,
+        )
+        # 仅缓存一页数据，客户端读取较慢时暂停获取下一页
+        queue = Queue(maxsize=1)
+
+        total = 0
+
+        async def callback():
+            nonlocal total
+            await acquirer.early_stop()
+            page, acquirer.response = acquirer.response, []
+            total += len(page)
+            await queue.put(page)
+
+        async def acquire():
+            # 被取消时不放入结束标记，队列已满且无人读取时会一直阻塞
+            try:
+                await acquirer.run(callback=callback)
+            except Exception:
+                await queue.put(None)
+                raise
+            acquirer.log.info(
+                _("共获取到 {count} 个{text}").format(count=total, text=acquirer.text)
+            )
+            await queue.put(None)
+
+        task = create_task(acquire())
+        root, params, logger = self.record.run(
+            self.parameter,
+            blank=True,
+        )
+        same = tab == "post"
+        name = mark = ""
+        try:
+            async with logger(root, console=self.console, **params) as recorder:
+                while (page := await queue.get()) is not None:
+                    if not page:
+                        continue
+                    if source:
+                        yield self.extractor.source_date_filter(
+                            page,
+                            acquirer.earliest,
+                            acquirer.latest,
+                            tiktok,
+                        )
+                        continue
+                    if same and not name:
+                        __, name, mark = self.extractor.preprocessing_data(
+                            page,
+                            tiktok,
+                            tab,
+                            user_id=sec_user_id,
+                        )
+                    yield await self.extractor.run(
+                        page,
+                        recorder,
+                        type_="batch",
+                        tiktok=tiktok,
+                        name=name,
+                        mark=mark,
+                        earliest=acquirer.earliest,
+                        latest=acquirer.latest,
+                        same=same,
+                    )
+            # 获取数据时发生的异常在此抛出
+            await task
+        finally:
+            task.cancel()
+
     async def get_user_info_data(
         self,
         tiktok=False,
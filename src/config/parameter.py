@@ -1,3 +1,5 @@
+from asyncio import create_task, gather
+from collections import OrderedDict
 from pathlib import Path
 from shutil import move
 from time import localtime, strftime
@@ -37,6 +39,8 @@ from ..tools import Cleaner, DownloaderError, cookie_dict_to_str, create_client
 from ..translation import _
 
 if TYPE_CHECKING:
+    from httpx import AsyncClient
+
     from ..manager import DownloadRecorder
     from ..module import Cookie
     from ..tools import ColorfulConsole
@@ -61,6 +65,7 @@ class Parameter:
         "http://": None,
         "https://": None,
     }
+    PROXY_CLIENT_LIMIT = 16
 
     def __init__(
         self,
@@ -208,6 +213,8 @@ class Parameter:
             timeout=self.timeout,
             proxy=self.proxy_tiktok,
         )
+        self.client_proxy: OrderedDict[str, "AsyncClient"] = OrderedDict()
+        self.client_closing = set()
 
         self.__generate_folders()
 
@@ -1005,9 +1012,29 @@ class Parameter:
     def check_str(value: str) -> str:
         return value if isinstance(value, str) else ""
 
+    def get_proxy_client(self, proxy: str) -> "AsyncClient":
+        """请求参数指定代理时，复用对应代理的客户端，仅保留最近使用的 PROXY_CLIENT_LIMIT 个"""
+        if client := self.client_proxy.get(proxy):
+            self.client_proxy.move_to_end(proxy)
+            return client
+        client = self.client_proxy[proxy] = create_client(
+            timeout=self.timeout,
+            proxy=proxy,
+        )
+        if len(self.client_proxy) > self.PROXY_CLIENT_LIMIT:
+            __, evicted = self.client_proxy.popitem(last=False)
+            task = create_task(evicted.aclose())
+            self.client_closing.add(task)
+            task.add_done_callback(self.client_closing.discard)
+        return client
+
     async def close_client(self) -> None:
         await self.client.aclose()
         await self.client_tiktok.aclose()
+        for client in self.client_proxy.values():
+            await client.aclose()
+        self.client_proxy.clear()
+        await gather(*self.client_closing)
 
     def __generate_folders(self):
         self.compatible()
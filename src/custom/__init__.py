@@ -58,6 +58,7 @@ from .static import (
     TEXT_REPLACEMENT,
     SERVER_HOST,
     SERVER_PORT,
+    SERVER_REQUEST_LOG,
     MASTER,
     PROMPT,
     WARNING,
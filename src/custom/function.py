@@ -1,4 +1,5 @@
 from asyncio import sleep
+from hmac import compare_digest
 from random import randint
 from typing import TYPE_CHECKING
 from src.translation import _
@@ -62,6 +63,14 @@ async def suspend(count: int, console: "ColorfulConsole") -> None:
     # pass
 
 
+# 自定义令牌，设置为空字符串代表禁用令牌验证
+TOKEN = ""
+_EXPECTED_TOKEN_BYTES = TOKEN.encode()
+
+
 def is_valid_token(token: str) -> bool:
     """Web API 接口模式 和 Web UI 交互模式 token 参数验证"""
-    return True
+    return not _EXPECTED_TOKEN_BYTES or compare_digest(
+        (token or "").encode(),
+        _EXPECTED_TOKEN_BYTES,
+    )
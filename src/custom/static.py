@@ -12,6 +12,9 @@ SERVER_HOST = "0.0.0.0"
 # 服务器模式端口，对 Web API 接口模式、Web UI 交互模式 生效
 SERVER_PORT = 5555
 
+# 是否记录每个请求的日志，对 Web API 接口模式生效，默认关闭以减少开销
+SERVER_REQUEST_LOG = False
+
 # Cookie 更新间隔，单位：秒
 COOKIE_UPDATE_INTERVAL = 15 * 60
 
@@ -149,7 +149,9 @@ class Account(API):
             *args,
             **kwargs,
         )
-        self.summary_works()
+        # 传入 callback 时，已获取的数据由调用方处理并汇总
+        if not callback:
+            self.summary_works()
 
     async def early_stop(self):
         """如果获取数据的发布日期已经早于限制日期，就不需要再获取下一页的数据了"""
@@ -2,7 +2,7 @@ from time import time
 from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
 from urllib.parse import quote, urlencode
 
-from httpx import AsyncClient, get, post
+from httpx import AsyncClient
 from rich.progress import (
     BarColumn,
     Progress,
@@ -81,6 +81,7 @@ class API:
         self.timeout = params.timeout
         self.cookie = cookie
         self.client: AsyncClient = params.client
+        self.get_proxy_client = params.get_proxy_client
         self.pages = 99999
         self.cursor = 0
         self.response = []
@@ -337,13 +338,9 @@ class API:
             headers,
             **kwargs,
         )
-        response = get(
+        response = await self.get_proxy_client(self.proxy).get(
             f"{url}?{params}",
             headers=headers,
-            proxy=self.proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
             **kwargs,
         )
         return await self.__return_response(response)
@@ -380,14 +377,10 @@ class API:
             headers,
             **kwargs,
         )
-        response = post(
+        response = await self.get_proxy_client(self.proxy).post(
             f"{url}?{params}",
             data=data,
             headers=headers,
-            proxy=self.proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
             **kwargs,
         )
         return await self.__return_response(response)
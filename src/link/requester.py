@@ -5,7 +5,7 @@ from ..custom import wait
 from ..tools import DownloaderError, Retry, capture_error_request
 
 if TYPE_CHECKING:
-    from httpx import AsyncClient, get, head
+    from httpx import AsyncClient
 
     from ..config import Parameter
 
@@ -22,6 +22,7 @@ class Requester:
         headers: dict[str, str],
     ):
         self.client = client
+        self.get_proxy_client = params.get_proxy_client
         self.headers = headers
         self.log = params.logger
         self.max_retry = params.max_retry
@@ -58,14 +59,14 @@ class Requester:
         self.log.info(f"URL: {url}", False)
         match (content in {"url", "headers"}, bool(proxy)):
             case True, True:
-                response = self.request_url_head_proxy(
+                response = await self.request_url_head_proxy(
                     url,
                     proxy,
                 )
             case True, False:
                 response = await self.request_url_head(url)
             case False, True:
-                response = self.request_url_get_proxy(
+                response = await self.request_url_get_proxy(
                     url,
                     proxy,
                 )
@@ -101,18 +102,14 @@ class Requester:
             headers=self.headers,
         )
 
-    def request_url_head_proxy(
+    async def request_url_head_proxy(
         self,
         url: str,
         proxy: str,
     ):
-        return head(
+        return await self.get_proxy_client(proxy).head(
             url,
             headers=self.headers,
-            proxy=proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
         )
 
     async def request_url_get(
@@ -126,18 +123,14 @@ class Requester:
         response.raise_for_status()
         return response
 
-    def request_url_get_proxy(
+    async def request_url_get_proxy(
         self,
         url: str,
         proxy: str,
     ):
-        response = get(
+        response = await self.get_proxy_client(proxy).get(
             url,
             headers=self.headers,
-            proxy=proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
         )
         response.raise_for_status()
         return response
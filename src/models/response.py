@@ -17,7 +17,7 @@ class DataResponse(BaseModel):
 
 class UrlResponse(BaseModel):
     message: str
-    url: str | None = None
+    url: str | list[str | None] | None = None
     params: dict | None
 
     @computed_field
@@ -1,6 +1,17 @@
-from pydantic import BaseModel
+from typing import Annotated
+
+from pydantic import BaseModel, Field
 
 
 class ShortUrl(BaseModel):
-    text: str
+    text: (
+        str
+        | Annotated[
+            list[str],
+            Field(
+                min_length=1,
+                max_length=20,
+            ),
+        ]
+    )
     proxy: str = ""
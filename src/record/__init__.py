@@ -1,4 +1,5 @@
 from .base import BaseLogger
 from .logger import LoggerManager
+from .monitor import setup_api_monitoring
 
-__all__ = ["LoggerManager", "BaseLogger"]
+__all__ = ["LoggerManager", "BaseLogger", "setup_api_monitoring"]
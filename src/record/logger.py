@@ -1,7 +1,10 @@
+from atexit import register
 from logging import INFO as INFO_LEVEL
 from logging import FileHandler, Formatter, getLogger
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from platform import system
+from queue import Queue
 from shutil import move
 from time import localtime, strftime
 from typing import TYPE_CHECKING
@@ -22,6 +25,9 @@ class LoggerManager(BaseLogger):
     """日志记录"""
 
     encode = "UTF-8-SIG" if system() == "Windows" else "UTF-8"
+    # 所有实例共用同一个记录器，仅保留最近一次 run() 创建的后台写入线程
+    _listener: QueueListener | None = None
+    _handler: QueueHandler | None = None
 
     def __init__(
         self, main_path: Path, console: "ColorfulConsole", root="", folder="", name=""
@@ -46,10 +52,27 @@ class LoggerManager(BaseLogger):
         )
         formatter = Formatter(format_, datefmt="%Y-%m-%d %H:%M:%S")
         file_handler.setFormatter(formatter)
+        self.stop()
+        # 日志文件写入由后台线程完成，避免阻塞事件循环
+        queue = Queue(-1)
+        LoggerManager._listener = QueueListener(queue, file_handler)
+        LoggerManager._handler = QueueHandler(queue)
+        LoggerManager._listener.start()
         self.log = getLogger(__name__)
-        self.log.addHandler(file_handler)
+        self.log.addHandler(self._handler)
         self.log.setLevel(INFO_LEVEL)
 
+    @classmethod
+    def stop(cls):
+        """停止后台写入线程，写入剩余日志并关闭日志文件"""
+        if not cls._listener:
+            return
+        getLogger(__name__).removeHandler(cls._handler)
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+        cls._listener = cls._handler = None
+
     def info(self, text: str, output=True, **kwargs):
         if output:
             self.console.print(text, style=INFO, **kwargs)
@@ -78,3 +101,6 @@ class LoggerManager(BaseLogger):
             old := self._root.parent.joinpath(self._folder)
         ).exists() and not path.exists():
             move(old, path)
+
+
+register(LoggerManager.stop)
@@ -0,0 +1,23 @@
+from logging import INFO as INFO_LEVEL
+from logging import Formatter, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from sys import stdout
+
+__all__ = ["setup_api_monitoring"]
+
+
+def setup_api_monitoring(
+    name="API_MONITOR",
+    format_="%(asctime)s[%(levelname)s]:  %(message)s",
+) -> QueueListener:
+    """Web API 模式请求日志，日志写入由后台线程完成，不阻塞事件循环"""
+    queue = Queue(-1)
+    handler = StreamHandler(stdout)
+    handler.setFormatter(Formatter(format_, datefmt="%Y-%m-%d %H:%M:%S"))
+    log = getLogger(name)
+    log.handlers.clear()
+    log.addHandler(QueueHandler(queue))
+    log.setLevel(INFO_LEVEL)
+    log.propagate = False
+    return QueueListener(queue, handler, respect_handler_level=True)
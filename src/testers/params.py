@@ -49,6 +49,12 @@ class Params:
             proxy="http://127.0.0.1:10808",
         )
 
+    def get_proxy_client(self, proxy: str):
+        return create_client(
+            timeout=self.timeout,
+            proxy=proxy,
+        )
+
     def create_ini(self):
         self.config["dy"] = {
             "cookie": "",
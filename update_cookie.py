@@ -8,10 +8,48 @@ Cookie 管理脚本
 import re
 import sys
 import json
+import os
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
 from argparse import ArgumentParser
+from codecs import BOM_UTF8
 from platform import system
 
+try:
+    from orjson import loads as load_json
+except ImportError:
+    load_json = json.loads
+
+_PROJECT_ROOT = Path(__file__).resolve().parent
+_ENCODING = "UTF-8-SIG" if system() == "Windows" else "UTF-8"
+# 可能的配置文件位置，按顺序查找
+_CANDIDATE_CONFIGS = (
+    _PROJECT_ROOT / "src" / "config" / "settings.json",
+    _PROJECT_ROOT / "settings.json",
+    _PROJECT_ROOT / "config.json",
+)
+# 已找到的配置文件位置
+_resolved_config = None
+# Windows 下需要以二进制模式写入，避免换行符被转换
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# 域名关键字与平台的对应关系，按顺序匹配
+_DOMAIN_TABLE = (
+    (b'douyin.com', 'douyin'),
+    (b'iesdouyin.com', 'douyin'),
+    (b'tiktok.com', 'tiktok'),
+    (b'kuaishou.com', 'kuaishou'),
+)
+
+# 各平台优先添加的 cookies
+_PRIORITY = {
+    'douyin': ('sessionid', 'sid_guard', 'uid_tt', 'sid_tt', 'ttwid', 'msToken'),
+    'tiktok': ('sessionid_ss', 'sessionid', 'ttwid', 'msToken', 'tt_csstoken'),
+    'kuaishou': ('userId', 'kpn', 'kpf', 'did', 'clientid', 'kuaishou.server.webday7_st'),
+}
+# 无法识别平台时的通用优先级
+_PRIORITY_DEFAULT = ('sessionid', 'sessionid_ss', 'userid', 'uid', 'ttwid')
+
 
 def parse_netscape_cookies(cookie_file_path):
     """
@@ -21,35 +59,52 @@ def parse_netscape_cookies(cookie_file_path):
     platform = None
 
     try:
-        with open(cookie_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # 跳过注释和空行
-                if not line or line.startswith('#'):
-                    continue
-
-                # 解析 cookie 行
-                parts = line.split('\t')
-                if len(parts) >= 7:
-                    domain, flag, path, secure, expiration, name, value = parts[:7]
-
-                    # 智能识别平台
-                    if 'douyin.com' in domain or 'iesdouyin.com' in domain:
-                        platform = 'douyin'
-                    elif 'tiktok.com' in domain:
-                        platform = 'tiktok'
-                    elif 'kuaishou.com' in domain:
-                        platform = 'kuaishou'
-
-                    # 只保留支持的平台域名
-                    if any(domain_keyword in domain for domain_keyword in
-                          ['douyin.com', 'iesdouyin.com', 'tiktok.com', 'kuaishou.com']):
-                        cookies.append({
-                            'name': name,
-                            'value': value,
-                            'domain': domain,
-                            'platform': platform
-                        })
+        with open(cookie_file_path, 'rb') as f:
+            # 空文件无法映射到内存
+            if not os.fstat(f.fileno()).st_size:
+                return cookies, platform
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+                # 直接在映射的内存中查找换行符，逐行切片
+                size = len(mm)
+                pos = 0
+                while pos < size:
+                    newline = mm.find(b'\n', pos)
+                    if newline < 0:
+                        newline = size
+                    line = mm[pos:newline].strip()
+                    pos = newline + 1
+                    # 跳过注释和空行
+                    if not line or line.startswith(b'#'):
+                        continue
+
+                    # 解析 cookie 行，定位制表符后直接切片所需字段，仅解码保留的字段
+                    tabs = []
+                    start = 0
+                    for _ in range(6):
+                        index = line.find(b'\t', start)
+                        if index < 0:
+                            break
+                        tabs.append(index)
+                        start = index + 1
+                    if len(tabs) < 6:
+                        continue
+                    domain = line[:tabs[0]]
+
+                    # 智能识别平台，只保留支持的平台域名
+                    for keyword, platform_ in _DOMAIN_TABLE:
+                        if keyword in domain:
+                            platform = platform_
+                            break
+                    else:
+                        continue
+
+                    end = line.find(b'\t', start)
+                    cookies.append({
+                        'name': line[tabs[4] + 1:tabs[5]].decode('utf-8'),
+                        'value': line[start:end if end >= 0 else None].decode('utf-8'),
+                        'domain': domain.decode('utf-8'),
+                        'platform': platform
+                    })
 
     except Exception as e:
         print(f"解析 cookie 文件失败: {e}")
@@ -66,31 +121,23 @@ def cookies_to_header_format(cookies, platform=None):
     if not cookies:
         return ""
 
-    # 根据平台设置优先级 cookies
-    priority_cookies = {
-        'douyin': ['sessionid', 'sid_guard', 'uid_tt', 'sid_tt', 'ttwid', 'msToken'],
-        'tiktok': ['sessionid_ss', 'sessionid', 'ttwid', 'msToken', 'tt_csstoken'],
-        'kuaishou': ['userId', 'kpn', 'kpf', 'did', 'clientid', 'kuaishou.server.webday7_st']
-    }
-
     # 使用指定平台的优先级，如果无法识别则使用通用优先级
-    current_priority = priority_cookies.get(platform, ['sessionid', 'sessionid_ss', 'userid', 'uid', 'ttwid'])
+    current_priority = _PRIORITY.get(platform, _PRIORITY_DEFAULT)
 
     # 处理重复的cookie名称，保留最后一个（后面的通常会覆盖前面的）
-    cookie_dict = {}
-    for cookie in cookies:
-        cookie_dict[cookie['name']] = cookie['value']
+    cookie_dict = {cookie['name']: cookie['value'] for cookie in cookies}
 
     # 优先添加重要的 cookies
     header_parts = []
-    for priority_name in current_priority:
-        if priority_name in cookie_dict:
-            header_parts.append(f"{priority_name}={cookie_dict[priority_name]}")
-            del cookie_dict[priority_name]
+    consumed = set()
+    if not cookie_dict.keys().isdisjoint(current_priority):
+        for priority_name in current_priority:
+            if priority_name in cookie_dict:
+                header_parts.append(f"{priority_name}={cookie_dict[priority_name]}")
+                consumed.add(priority_name)
 
     # 添加其他 cookies
-    for name, value in cookie_dict.items():
-        header_parts.append(f"{name}={value}")
+    header_parts.extend(f"{name}={value}" for name, value in cookie_dict.items() if name not in consumed)
 
     return "; ".join(header_parts)
 
@@ -99,47 +146,90 @@ def detect_platform_from_cookies(cookies):
     """
     从 cookies 中检测平台类型
     """
-    domains = [cookie.get('domain', '') for cookie in cookies]
-
-    if any('douyin.com' in domain or 'iesdouyin.com' in domain for domain in domains):
-        return 'douyin'
-    elif any('tiktok.com' in domain for domain in domains):
-        return 'tiktok'
-    elif any('kuaishou.com' in domain for domain in domains):
-        return 'kuaishou'
+    # 单次遍历，按抖音、TikTok、快手的优先级返回
+    platform = None
+    for cookie in cookies:
+        domain = cookie.get('domain', '')
+        # iesdouyin.com 同样包含 douyin.com
+        if 'douyin.com' in domain:
+            return 'douyin'
+        if platform != 'tiktok':
+            if 'tiktok.com' in domain:
+                platform = 'tiktok'
+            elif platform is None and 'kuaishou.com' in domain:
+                platform = 'kuaishou'
+    return platform
+
+
+def parse_config(data):
+    """
+    解析 JSON 配置文件内容，兼容带 BOM 的文件
+    """
+    return load_json(data.removeprefix(BOM_UTF8))
+
+
+def dump_config(config, compact=False):
+    """
+    序列化配置数据，默认保留缩进便于手动编辑
+    """
+    if compact:
+        text = json.dumps(config, ensure_ascii=False, separators=(',', ':'))
     else:
-        return None
+        text = json.dumps(config, indent=4, ensure_ascii=False)
+    return text.encode(_ENCODING)
 
 
-def update_config_cookie(cookie_string, platform, config_file=None):
+def write_config_atomic(path, payload):
+    """
+    先写入同目录下的临时文件再替换，避免其他进程读取到写入一半的配置文件
+    """
+    # 符号链接替换其指向的文件，保留链接本身
+    path = path.resolve()
+    # 沿用原文件的权限，避免包含 Cookie 的配置文件被放宽权限
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(temp, _WRITE_FLAGS, 0o666 if mode is None else mode)
+    try:
+        try:
+            if mode is not None and hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(temp, path)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def update_config_cookie(cookie_string, platform, config_file=None, compact=False):
     """
     更新配置文件中的 cookie
     """
-    project_root = Path(__file__).parent
+    global _resolved_config
 
     if config_file is None:
         # 尝试多个可能的配置文件位置
-        config_files = [
-            project_root / "src" / "config" / "settings.json",
-            project_root / "settings.json",
-            project_root / "config.json",
-        ]
-        config_file = next((f for f in config_files if f.exists()), None)
+        if _resolved_config is None:
+            _resolved_config = next((f for f in _CANDIDATE_CONFIGS if f.exists()), None)
+        config_file = _resolved_config
 
     if config_file is None:
         # 如果没有找到配置文件，使用默认位置
-        config_file = project_root / "src" / "config" / "settings.json"
+        config_file = _CANDIDATE_CONFIGS[0]
     else:
         # 确保config_file是Path对象
         config_file = Path(config_file)
 
-    encode = "UTF-8-SIG" if system() == "Windows" else "UTF-8"
-
     try:
         # 读取现有配置
         if config_file.exists():
-            with config_file.open('r', encoding=encode) as f:
-                config = json.load(f)
+            config = parse_config(config_file.read_bytes())
         else:
             print("配置文件不存在，将创建新配置文件")
             config = {}
@@ -164,35 +254,42 @@ def update_config_cookie(cookie_string, platform, config_file=None):
         # 确保目录存在
         config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # 写入配置文件
-        with config_file.open('w', encoding=encode) as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        # 写入配置文件，序列化结果同时用于同步 Volume 配置文件
+        payload = dump_config(config, compact)
+        write_config_atomic(config_file, payload)
 
         print(f"✅ {platform_name} Cookie 已成功更新到配置文件: {config_file}")
         print(f"   配置键: {cookie_key}")
 
         # 🎯 同时更新Volume目录下的配置文件（API模式使用）
-        volume_config = project_root / "Volume" / "settings.json"
+        volume_config = _PROJECT_ROOT / "Volume" / "settings.json"
         try:
             if volume_config.exists():
-                with volume_config.open('r', encoding=encode) as f:
-                    volume_data = json.load(f)
-            else:
-                volume_data = config.copy()
+                current = volume_config.read_bytes()
+                volume_data = parse_config(current)
 
-            # 同步cookie配置
-            if platform == 'tiktok':
-                volume_data['cookie_tiktok'] = cookie_string
+                # 同步cookie配置
+                if platform == 'tiktok':
+                    volume_data['cookie_tiktok'] = cookie_string
+                else:
+                    volume_data['cookie'] = cookie_string
+
+                volume_payload = dump_config(volume_data, compact)
             else:
-                volume_data['cookie'] = cookie_string
+                current = None
+                # 不存在时内容与主配置文件一致，直接复用序列化结果
+                volume_payload = payload
 
-            # 确保Volume目录存在
-            volume_config.parent.mkdir(parents=True, exist_ok=True)
+            # 内容未变化时跳过写入
+            if volume_payload == current:
+                print(f"✅ {platform_name} Cookie 与API配置文件一致，无需同步: {volume_config}")
+            else:
+                # 确保Volume目录存在
+                volume_config.parent.mkdir(parents=True, exist_ok=True)
 
-            with volume_config.open('w', encoding=encode) as f:
-                json.dump(volume_data, f, indent=4, ensure_ascii=False)
+                write_config_atomic(volume_config, volume_payload)
 
-            print(f"✅ {platform_name} Cookie 已同步到API配置文件: {volume_config}")
+                print(f"✅ {platform_name} Cookie 已同步到API配置文件: {volume_config}")
 
         except Exception as e:
             print(f"⚠️  同步API配置文件失败: {e}")
@@ -214,6 +311,7 @@ def main():
                        default='auto', help='指定平台类型 (默认: auto)')
     parser.add_argument('--config', help='指定配置文件路径')
     parser.add_argument('--dry-run', action='store_true', help='仅解析不更新配置')
+    parser.add_argument('--compact', action='store_true', help='以紧凑格式写入配置文件（不缩进）')
 
     args = parser.parse_args()
 
@@ -265,7 +363,7 @@ def main():
 
     # 更新配置文件
     print("🔄 正在更新配置文件...")
-    if update_config_cookie(cookie_header, platform, args.config):
+    if update_config_cookie(cookie_header, platform, args.config, args.compact):
         print("🎉 Cookie 更新完成！")
 
         # 显示使用建议